@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Iterable, Mapping, Set, Tuple, Union
 
 
@@ -111,8 +112,12 @@ def iter_rules() -> Iterable[RosterRules]:
     return _ROSTER_RULES.values()
 
 
+@lru_cache(maxsize=64)
 def get_rules(site: str, sport: str) -> RosterRules:
-    """Fetch rules for a site/sport pair, raising KeyError if missing."""
+    """Fetch rules for a site/sport pair, raising KeyError if missing.
+
+    Results are cached per argument pair; misses raise and are not cached.
+    """
 
     key = (site.upper(), sport.upper())
     if key not in _ROSTER_RULES:
@@ -120,6 +125,7 @@ def get_rules(site: str, sport: str) -> RosterRules:
     return _ROSTER_RULES[key]
 
 
+@lru_cache(maxsize=64)
 def get_rules_by_key(site_key: Union[str, Tuple[str, str]]) -> RosterRules:
     """Resolve rules using either "SITE_SPORT" or (site, sport)."""
 
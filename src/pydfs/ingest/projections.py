@@ -5,9 +5,11 @@ from __future__ import annotations
 import csv
 import logging
 import re
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Mapping, Optional, Sequence, Tuple
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -53,8 +55,18 @@ NFL_TEAM_ALIAS_GROUPS: dict[str, list[str]] = {
 }
 
 
+# Separators seen in team names ("Miami D/ST", "St. Louis", "SF 49ers"); stripping
+# them with one translate call covers nearly every input without the regex.
+_TEAM_PUNCTUATION = str.maketrans("", "", " /.'-&_,()")
+_TEAM_TOKEN_STRIP = re.compile(r"[^A-Z0-9]")
+_DEFENSE_NAME_PATTERN = re.compile(r"\b(?:D/?ST|DST|DEF(?:ENSE)?)\b", re.IGNORECASE)
+
+
 def _team_token(value: str) -> str:
-    return re.sub(r"[^A-Z0-9]", "", value.upper())
+    token = value.upper().translate(_TEAM_PUNCTUATION)
+    if token.isascii() and token.isalnum():
+        return token
+    return _TEAM_TOKEN_STRIP.sub("", token)
 
 
 def _build_alias_lookup() -> dict[str, dict[str, str]]:
@@ -79,7 +91,7 @@ def _infer_team_from_name(name: str, sport: str) -> str | None:
         return None
     if token in lookup:
         return lookup[token]
-    cleaned_name = re.sub(r"\b(?:D/?ST|DST|DEF(?:ENSE)?)\b", "", name, flags=re.IGNORECASE)
+    cleaned_name = _DEFENSE_NAME_PATTERN.sub("", name)
     cleaned_token = _team_token(cleaned_name)
     if cleaned_token and cleaned_token in lookup:
         return lookup[cleaned_token]
@@ -101,14 +113,15 @@ class ProjectionRow(BaseModel):
 
     @classmethod
     def from_mapping(cls, row: Mapping[str, str], mapping: Mapping[str, str]) -> "ProjectionRow":
-        def extract(spec: Optional[str | Sequence[str]], *, default: Optional[str] = None) -> Optional[str]:
-            if spec is None:
-                return default
-            if isinstance(spec, str):
-                value = row.get(spec)
-                return value.strip() if value is not None else default
-            parts = [row.get(col, "").strip() for col in spec if row.get(col)]
-            return " ".join(parts) if parts else default
+        return cls.resolver(mapping)(row)
+
+    @classmethod
+    def resolver(cls, mapping: Mapping[str, str]) -> Callable[[Mapping[str, str]], "ProjectionRow"]:
+        """Parse ``mapping`` once and return a row -> ``ProjectionRow`` converter.
+
+        Column specs (including ``"First|Last"`` composites) are resolved up
+        front, so loading a file does the mapping work once rather than per row.
+        """
 
         def parse_spec(key: str, default_key: Optional[str] = None) -> Optional[str | Sequence[str]]:
             spec = mapping.get(key)
@@ -120,29 +133,43 @@ class ProjectionRow(BaseModel):
                 return tuple(part.strip() for part in spec.split("|"))
             return spec
 
+        fields = (
+            ("raw_id", parse_spec("player_id"), None),
+            ("raw_name", parse_spec("name", "name"), ""),
+            ("raw_team", parse_spec("team", "team"), ""),
+            ("raw_position", parse_spec("position"), None),
+            ("raw_salary", parse_spec("salary", "salary"), "0"),
+            ("raw_projection", parse_spec("projection", "projection"), "0"),
+            ("raw_injury_status", parse_spec("injury_status"), None),
+            ("raw_probable_pitcher", parse_spec("probable_pitcher"), None),
+            ("raw_game", parse_spec("game"), None),
+            ("raw_opponent", parse_spec("opponent"), None),
+        )
         ownership_spec = mapping.get("ownership")
-        ownership_value = None
-        if ownership_spec:
-            raw = row.get(ownership_spec)
-            try:
-                ownership_value = float(raw) if raw not in (None, "") else None
-            except (TypeError, ValueError):
-                ownership_value = None
-
-        data = {
-            "raw_id": extract(parse_spec("player_id")),
-            "raw_name": extract(parse_spec("name", "name"), default=""),
-            "raw_team": extract(parse_spec("team", "team"), default=""),
-            "raw_position": extract(parse_spec("position")),
-            "raw_salary": extract(parse_spec("salary", "salary"), default="0"),
-            "raw_projection": extract(parse_spec("projection", "projection"), default="0"),
-            "ownership": ownership_value,
-            "raw_injury_status": extract(parse_spec("injury_status")),
-            "raw_probable_pitcher": extract(parse_spec("probable_pitcher")),
-            "raw_game": extract(parse_spec("game")),
-            "raw_opponent": extract(parse_spec("opponent")),
-        }
-        return cls(**data)
+
+        def convert(row: Mapping[str, str]) -> "ProjectionRow":
+            data: dict[str, Any] = {}
+            for field, spec, default in fields:
+                if spec is None:
+                    data[field] = default
+                elif isinstance(spec, str):
+                    value = row.get(spec)
+                    data[field] = value.strip() if value is not None else default
+                else:
+                    parts = [row.get(col, "").strip() for col in spec if row.get(col)]
+                    data[field] = " ".join(parts) if parts else default
+
+            ownership_value = None
+            if ownership_spec:
+                raw = row.get(ownership_spec)
+                try:
+                    ownership_value = float(raw) if raw not in (None, "") else None
+                except (TypeError, ValueError):
+                    ownership_value = None
+            data["ownership"] = ownership_value
+            return cls(**data)
+
+        return convert
 
 
 DEFAULT_PROJECTION_MAPPING = {
@@ -169,23 +196,39 @@ DEFAULT_PLAYERS_MAPPING = {
 }
 
 
+@lru_cache(maxsize=1024)
 def _canonical_team(team: str, sport: str) -> str:
     token = _team_token(team)
     if not token:
-        return team.upper()
+        return sys.intern(team.upper())
     sport_key = sport.upper()
     lookup = TEAM_ALIAS_LOOKUP.get(sport_key, {})
     if token in lookup:
         return lookup[token]
     # Some data sources only provide the abbreviation already; ensure it stays uppercase.
-    return team.upper()
+    return sys.intern(team.upper())
+
+
+# Distinct position lists on a slate number in the dozens; records share the
+# interned strings instead of each holding its own "OF"/"RB" copies.
+_POSITIONS_CACHE: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def _shared_positions(positions: Iterable[str]) -> List[str]:
+    key = tuple(positions)
+    shared = _POSITIONS_CACHE.get(key)
+    if shared is None:
+        shared = _POSITIONS_CACHE.setdefault(key, tuple(map(sys.intern, key)))
+    return list(shared)
 
 
 def load_projection_csv(path: Path, *, mapping: Mapping[str, str] | None = None) -> List[ProjectionRow]:
     mapping = mapping or DEFAULT_PROJECTION_MAPPING
-    with path.open(newline="", encoding="utf-8") as f:
+    convert = ProjectionRow.resolver(mapping)
+    # utf-8-sig drops the BOM Excel writes in front of the first header.
+    with path.open(newline="", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
-        rows = [ProjectionRow.from_mapping(row, mapping) for row in reader]
+        rows = [convert(row) for row in reader]
     return rows
 
 
@@ -246,25 +289,38 @@ def infer_site_variant(site: str, sport: str, rows: Sequence["ProjectionRow"]) -
     return site_key, sport_key
 
 
-def _canonical_positions(site: str, sport: str, position: Optional[str]) -> List[str]:
-    if not position:
-        return []
+_POSITION_ALIASES = {"DST": "D", "D/ST": "D", "DEF": "D", "DEFENSE": "D"}
+_DROPPED_POSITIONS = frozenset({"OL"})
+
+
+@lru_cache(maxsize=1024)
+def _canonical_position_tuple(site: str, sport: str, position: str) -> tuple[str, ...]:
+    """Canonical positions for one raw position string, cached per site/sport.
+
+    A slate only carries a handful of distinct position strings, so almost
+    every row is a cache hit.
+    """
+
     rules = get_rules(site, sport)
     tokens = [token.strip().upper() for token in position.split("/") if token.strip()]
     if not tokens:
-        return []
+        return ()
 
     valid = set().union(*rules.slot_positions.values())
     normalized = []
     for token in tokens:
-        normalized_token = token
-        if token in {"DST", "D/ST", "DEF", "DEFENSE"}:
-            normalized_token = "D"
-        elif token == "OL":
+        if token in _DROPPED_POSITIONS:
             continue
+        normalized_token = _POSITION_ALIASES.get(token, token)
         if normalized_token in valid:
             normalized.append(normalized_token)
-    return normalized or tokens
+    return tuple(map(sys.intern, normalized or tokens))
+
+
+def _canonical_positions(site: str, sport: str, position: Optional[str]) -> List[str]:
+    if not position:
+        return []
+    return list(_canonical_position_tuple(site, sport, position))
 
 
 def rows_to_records(
@@ -287,7 +343,7 @@ def rows_to_records(
         if (
             not team_abbrev
             and sport_upper == "NFL"
-            and ("D" in positions or _SINGLE_GAME_DEFENSE_PATTERN.search(row.raw_name or ""))
+            and ("D" in positions or _DEFENSE_NAME_PATTERN.search(row.raw_name or ""))
         ):
             inferred_team = _infer_team_from_name(row.raw_name, sport)
             if inferred_team:
@@ -302,7 +358,7 @@ def rows_to_records(
             defense_key = _record_key(row.raw_name, team_abbrev, is_defense=True)
             fallback_positions = fallback_positions_by_key.get(defense_key)
         if not positions and fallback_positions:
-            positions = [pos for pos in fallback_positions if pos]
+            positions = _shared_positions(pos for pos in fallback_positions if pos)
         metadata: dict[str, object] = {}
         if row.ownership is not None:
             metadata["projected_ownership"] = row.ownership
@@ -348,7 +404,7 @@ def load_records_from_csv(
 
 _NAME_SUFFIX_TOKENS = {"jr", "sr", "ii", "iii", "iv", "v"}
 _DEFENSE_TOKENS = {"dst", "defense", "def", "d"}
-_SINGLE_GAME_DEFENSE_PATTERN = re.compile(r"\b(?:D/?ST|DST|DEF(?:ENSE)?)\b", re.IGNORECASE)
+_NAME_SEPARATORS = re.compile(r"[^a-z0-9]+")
 
 
 def _is_fanduel_single_game_defense(
@@ -361,12 +417,12 @@ def _is_fanduel_single_game_defense(
         return False
     if not row.raw_name:
         return False
-    return bool(_SINGLE_GAME_DEFENSE_PATTERN.search(row.raw_name))
+    return bool(_DEFENSE_NAME_PATTERN.search(row.raw_name))
 
 
 def _normalize_name(name: str, *, is_defense: bool = False, team: str | None = None) -> str:
     lowered = name.lower()
-    cleaned = re.sub(r"[^a-z0-9]+", " ", lowered)
+    cleaned = _NAME_SEPARATORS.sub(" ", lowered)
     tokens = [tok for tok in cleaned.split() if tok]
     tokens = [tok for tok in tokens if tok not in _NAME_SUFFIX_TOKENS]
 
@@ -548,7 +604,7 @@ def merge_player_and_projection_files(
         defense_name = (
             "D" in positions
             or (fallback_positions and any(pos == "D" for pos in fallback_positions))
-            or _SINGLE_GAME_DEFENSE_PATTERN.search(row.raw_name or "")
+            or _DEFENSE_NAME_PATTERN.search(row.raw_name or "")
         )
         if not team_abbrev and sport_upper == "NFL" and defense_name:
             inferred_team = _infer_team_from_name(row.raw_name, sport)
@@ -630,7 +686,7 @@ def merge_player_and_projection_files(
         elif fallback_positions:
             chosen_positions = fallback_positions
         if chosen_positions:
-            update["positions"] = list(chosen_positions)
+            update["positions"] = _shared_positions(chosen_positions)
         resolved_player_id = row.raw_id or (override_id if override_key else None)
         if resolved_player_id:
             update["player_id"] = resolved_player_id
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from functools import lru_cache
 import logging
 import multiprocessing as mp
 import os
-import random
+import queue
+import signal
 import time
 from collections import defaultdict
 from typing import Any, Iterable, List, Optional, Sequence, Tuple, Mapping
 
+import numpy as np
 from pydfs_lineup_optimizer import Site, Sport, get_optimizer
 from pydfs_lineup_optimizer.lineup import Lineup
 from pydfs_lineup_optimizer.player_pool import LineupPosition, PlayerPool
@@ -33,6 +37,7 @@ _PLAYER_RETAIN_DEFAULT = 0.75
 _PLAYER_MIN_PER_POS_DEFAULT = 8
 _EXPOSURE_BIAS_DEFAULT_TARGET = 0.4
 _EXPOSURE_BIAS_WARMUP_LINEUPS = 25
+_WORKER_START_TIMEOUT = 30.0
 
 _SINGLE_GAME_MULTIPLIERS: dict[str, dict[str, float]] = {
     "NFL": {"MVP": 1.5},
@@ -403,12 +408,12 @@ def _expand_single_game_records(
     records: Sequence[PlayerRecord], *, site: str, sport: str
 ) -> list[PlayerRecord]:
     if site.upper() != "FD_SINGLE":
-        return [record.model_copy() for record in records]
+        return list(records)
 
     sport_key = sport.upper()
     role_map = _SINGLE_GAME_MULTIPLIERS.get(sport_key)
     if not role_map:
-        return [record.model_copy() for record in records]
+        return list(records)
 
     allowed_positions = _SINGLE_GAME_ALLOWED_BASE_POSITIONS.get(sport_key)
     expanded: list[PlayerRecord] = []
@@ -509,15 +514,25 @@ def _apply_bias_to_records(
     if not bias_factors:
         return list(records)
 
+    players = list(records)
+    count = len(players)
+    projections = np.fromiter((record.projection for record in players), dtype=np.float64, count=count)
+    biases = np.fromiter(
+        (bias_factors.get(record.player_id, 1.0) for record in players), dtype=np.float64, count=count
+    )
+    biases = np.maximum(biases, 0.0)
+    biased = np.maximum(projections * biases, 0.0)
+
+    # Every record is annotated, including unbiased ones, so the baseline
+    # projection survives the perturbation applied later in the job.
     biased_records: list[PlayerRecord] = []
-    for record in records:
-        bias = float(bias_factors.get(record.player_id, 1.0))
-        bias = max(0.0, bias)
-        new_projection = max(0.0, record.projection * bias)
-        metadata = dict(record.metadata)
-        metadata.setdefault("baseline_projection", float(metadata.get("baseline_projection", record.projection)))
-        metadata["bias_factor"] = bias
-        metadata["biased_projection"] = new_projection
+    for record, bias, new_projection in zip(players, biases.tolist(), biased.tolist()):
+        metadata = {
+            **record.metadata,
+            "baseline_projection": float(record.metadata.get("baseline_projection", record.projection)),
+            "bias_factor": bias,
+            "biased_projection": new_projection,
+        }
         biased_records.append(
             record.model_copy(update={"projection": new_projection, "metadata": metadata})
         )
@@ -536,6 +551,64 @@ def _perturbation_window(percentile: float, pct25: float, pct75: float) -> float
     return pct25 + (pct75 - pct25) * t
 
 
+def _perturbation_windows(percentiles: np.ndarray, pct25: float, pct75: float) -> np.ndarray:
+    """Vectorised ``_perturbation_window`` over an array of percentiles."""
+
+    low = pct25 * (1.5 - 0.5 * (percentiles / 0.25))
+    high = pct75 * (1.0 - 0.5 * ((percentiles - 0.75) / 0.25))
+    mid = pct25 + (pct75 - pct25) * ((percentiles - 0.25) / 0.5)
+    windows = np.where(percentiles <= 0.25, low, np.where(percentiles >= 0.75, high, mid))
+    return np.maximum(windows, 0.0)
+
+
+@lru_cache(maxsize=32)
+def _rank_windows(count: int, pct25: float, pct75: float) -> np.ndarray:
+    """Windows for ranks ``0..count-1`` of a pool, shared by every batch of a run.
+
+    Percentiles are exactly ``rank / (count - 1)``, so the table is exact rather
+    than a discretised approximation. The cached array is read-only.
+    """
+
+    windows = _perturbation_windows(np.arange(count) / max(count - 1, 1), pct25, pct75)
+    windows.setflags(write=False)
+    return windows
+
+
+@dataclass(frozen=True, eq=False)
+class _PlayerTable:
+    """Projection column aligned with a fixed tuple of records.
+
+    Transforms work on ``projection`` as an array; records are only
+    materialised again with ``to_records``.
+    """
+
+    records: tuple[PlayerRecord, ...]
+    projection: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: Iterable[PlayerRecord]) -> "_PlayerTable":
+        rows = tuple(records)
+        projection = np.fromiter((row.projection for row in rows), dtype=np.float64, count=len(rows))
+        projection.setflags(write=False)
+        return cls(records=rows, projection=projection)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def to_records(self, projection: np.ndarray) -> List[PlayerRecord]:
+        """Materialise records, copying only those whose projection changed.
+
+        ``model_copy`` is shallow, so copies share the source record's
+        ``metadata`` dict rather than allocating one.
+        """
+
+        changed = (projection != self.projection).tolist()
+        return [
+            record.model_copy(update={"projection": value}) if differs else record
+            for record, differs, value in zip(self.records, changed, projection.tolist())
+        ]
+
+
 def _perturb_projections(
     records: Sequence[PlayerRecord],
     *,
@@ -543,38 +616,31 @@ def _perturb_projections(
     percentile_25: float,
     percentile_75: float,
 ) -> list[PlayerRecord]:
-    """Return a new list of records with projections randomly nudged up/down."""
+    """Return a new list of records with projections randomly nudged up/down.
+
+    Records are frozen, so players whose projection is unchanged are returned
+    as-is. Offsets are drawn in one batch from
+    ``numpy.random.default_rng(seed)``, one per record in input order.
+    """
 
     pct25 = max(0.0, percentile_25 / 100.0)
     pct75 = max(0.0, percentile_75 / 100.0)
     if max(pct25, pct75) <= 0:
         return list(records)
 
-    rng = random.Random(seed)
-    players = list(records)
-    if not players:
+    table = _PlayerTable.from_records(records)
+    count = len(table)
+    if not count:
         return []
 
-    indexed_players = list(enumerate(players))
-    sorted_pairs = sorted(indexed_players, key=lambda item: item[1].projection)
-    max_rank = max(len(players) - 1, 1)
+    order = np.argsort(table.projection, kind="stable")
+    ranks = np.empty(count, dtype=np.intp)
+    ranks[order] = np.arange(count)
+    windows = _rank_windows(count, pct25, pct75)[ranks]
 
-    perturbation_windows: dict[int, float] = {}
-    for rank, (original_index, player) in enumerate(sorted_pairs):
-        percentile = rank / max_rank
-        perturbation_windows[original_index] = max(0.0, _perturbation_window(percentile, pct25, pct75))
-
-    cloned: list[PlayerRecord] = []
-    for idx, player in enumerate(players):
-        magnitude = perturbation_windows.get(idx, 0.0)
-        if magnitude <= 0.0:
-            cloned.append(player.model_copy())
-            continue
-        offset = rng.uniform(-magnitude, magnitude)
-        offset = max(-0.99, min(0.99, offset))
-        new_projection = max(0.0, player.projection * (1.0 + offset))
-        cloned.append(player.model_copy(update={"projection": new_projection}))
-    return cloned
+    offsets = np.random.default_rng(seed).uniform(-windows, windows)
+    np.clip(offsets, -0.99, 0.99, out=offsets)
+    return table.to_records(np.maximum(table.projection * (1.0 + offsets), 0.0))
 
 
 def _lineup_signature(lineup: LineupResult) -> tuple[str, ...]:
@@ -601,11 +667,45 @@ def _run_parallel_job(config: "ParallelLineupJobConfig") -> ParallelLineupJobRes
         return ParallelLineupJobResult(config.job_id, exc.lineups, config.seed, error=exc.message)
 
 
-def _parallel_worker(config: "ParallelLineupJobConfig", queue: mp.Queue) -> None:
-    try:
-        queue.put(_run_parallel_job(config))
-    except Exception as exc:  # pragma: no cover - worker errors bubble to parent
-        queue.put(exc)
+def _report_worker_pid(worker_pids: Any) -> None:
+    worker_pids.put(os.getpid())
+
+
+def _start_worker_pool(workers: int) -> tuple[ProcessPoolExecutor, Any]:
+    """Spawn a process pool whose workers report their PID on start-up."""
+
+    ctx = mp.get_context("spawn")
+    worker_pids = ctx.Queue()
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=ctx,
+        initializer=_report_worker_pid,
+        initargs=(worker_pids,),
+    )
+    return executor, worker_pids
+
+
+def _terminate_executor(executor: ProcessPoolExecutor, worker_pids: Any) -> None:
+    """Drop queued jobs and stop workers still solving batches we no longer need.
+
+    Killing any worker breaks the pool, and the executor then terminates the
+    remaining workers itself, including ones that have not reported yet. If no
+    worker has reported, wait for the first one to finish starting.
+    """
+
+    pids: set[int] = set()
+    while True:
+        try:
+            pids.add(worker_pids.get(block=not pids, timeout=_WORKER_START_TIMEOUT))
+        except queue.Empty:
+            break
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    executor.shutdown(wait=True, cancel_futures=True)
+    worker_pids.close()
 
 
 def _normalize_percentage(value: float | None) -> float | None:
@@ -657,8 +757,13 @@ def generate_lineups_parallel(
     min_salary: Optional[int] = None,
     exposure_bias: float | None = None,
     exposure_bias_target: float | None = None,
+    seed: int | None = None,
     ) -> BuildOutput:
-    """Generate lineups across multiple processes with slight projection perturbations."""
+    """Generate lineups across multiple processes with slight projection perturbations.
+
+    Job seeds are spawned from one ``numpy.random.SeedSequence(seed)``; pass
+    ``seed`` to make the perturbations reproducible.
+    """
 
     total_lineups = max(0, total_lineups)
     if total_lineups == 0:
@@ -697,6 +802,7 @@ def generate_lineups_parallel(
         bias_target = _EXPOSURE_BIAS_DEFAULT_TARGET
     usage_counts: defaultdict[str, int] = defaultdict(int)
     last_bias_snapshot: dict[str, float] = {}
+    seed_root = np.random.SeedSequence(seed)
 
     position_counts: dict[str, int] = defaultdict(int)
     for record in records_list:
@@ -751,10 +857,10 @@ def generate_lineups_parallel(
         return bias_map
 
     def build_config(job_id: int, batch: int, records_for_job: Optional[Sequence[PlayerRecord]] = None, bias_map: Optional[dict[str, float]] = None) -> ParallelLineupJobConfig:
-        seed = random.randint(1, 2 ** 31 - 1)
+        (job_seed,) = seed_root.spawn(1)
         return ParallelLineupJobConfig(
             job_id=job_id,
-            seed=seed,
+            seed=int(job_seed.generate_state(1)[0]),
             records=list(records_for_job) if records_for_job is not None else list(records_list),
             site=site,
             sport=sport,
@@ -776,7 +882,8 @@ def generate_lineups_parallel(
         for lineup in outcome.lineups:
             if remaining_lineups() <= 0:
                 break
-            results.append(lineup)
+            # Every job numbers its lineups from L001; renumber across the whole run.
+            results.append(replace(lineup, lineup_id=f"L{len(results) + 1:03}"))
             appended += 1
             signature = _lineup_signature(lineup)
             if signature not in seen_signatures:
@@ -856,10 +963,10 @@ def generate_lineups_parallel(
             )
         return BuildOutput(results[:total_lineups], bias_summary)
 
-    ctx = mp.get_context('spawn')
-    queue: mp.Queue = ctx.Queue()
-
-    processes: dict[int, mp.Process] = {}
+    # Worker processes are reused across batches so the spawn/import cost is
+    # paid once per worker rather than once per batch.
+    executor, worker_pids = _start_worker_pool(workers)
+    pending: dict[Future, int] = {}
     next_job_id = 0
 
     def start_job(batch: int) -> None:
@@ -883,67 +990,56 @@ def generate_lineups_parallel(
             pool_size,
             pos_log,
         )
-        proc = ctx.Process(target=_parallel_worker, args=(config, queue))
-        proc.start()
-        processes[config.job_id] = proc
+        pending[executor.submit(_run_parallel_job, config)] = config.job_id
         next_job_id += 1
 
     partial_error: str | None = None
+    stop_requested = False
     try:
-        while len(processes) < workers and remaining_lineups() > 0:
+        while len(pending) < workers and remaining_lineups() > 0:
             start_job(min(per_job, remaining_lineups()))
 
-        stop_requested = False
-        while processes:
-            outcome = queue.get()
-            if isinstance(outcome, Exception):
-                raise outcome
+        while pending and not stop_requested:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.pop(future)
+                outcome = future.result()
 
-            proc = processes.pop(outcome.job_id, None)
-            if proc is not None:
-                proc.join()
-
-            batch_start = time.perf_counter()
-            added, new_unique, inner_elapsed = apply_outcome(outcome, batch_start)
-            logger.info(
-                "Batch %s completed – added %s lineups (%s new); total %s/%s (unique %s, seed=%s, total %.2fs, batch %.2fs, pool=%s, positions=%s)",
-                outcome.job_id,
-                added,
-                new_unique,
-                len(results),
-                total_lineups,
-                len(seen_signatures),
-                outcome.seed,
-                time.perf_counter() - run_start,
-                inner_elapsed,
-                pool_size,
-                pos_log,
-            )
+                batch_start = time.perf_counter()
+                added, new_unique, inner_elapsed = apply_outcome(outcome, batch_start)
+                logger.info(
+                    "Batch %s completed – added %s lineups (%s new); total %s/%s (unique %s, seed=%s, total %.2fs, batch %.2fs, pool=%s, positions=%s)",
+                    outcome.job_id,
+                    added,
+                    new_unique,
+                    len(results),
+                    total_lineups,
+                    len(seen_signatures),
+                    outcome.seed,
+                    time.perf_counter() - run_start,
+                    inner_elapsed,
+                    pool_size,
+                    pos_log,
+                )
 
-            if outcome.error and partial_error is None:
-                logger.warning("Batch %s stopped early: %s", outcome.job_id, outcome.error)
-                partial_error = outcome.error
-                stop_requested = True
-                break
+                if outcome.error and partial_error is None:
+                    logger.warning("Batch %s stopped early: %s", outcome.job_id, outcome.error)
+                    partial_error = outcome.error
+                    stop_requested = True
+                    break
 
-            if remaining_lineups() <= 0:
-                stop_requested = True
-                break
+                if remaining_lineups() <= 0:
+                    stop_requested = True
+                    break
 
-            while len(processes) < workers and remaining_lineups() > 0:
+            while not stop_requested and len(pending) < workers and remaining_lineups() > 0:
                 start_job(min(per_job, remaining_lineups()))
-        if stop_requested:
-            for proc in processes.values():
-                if proc.is_alive():
-                    proc.terminate()
-                proc.join()
-        else:
-            for proc in processes.values():
-                proc.join()
     finally:
-        for proc in processes.values():
-            if proc.is_alive():
-                proc.terminate()
+        if pending:
+            _terminate_executor(executor, worker_pids)
+        else:
+            executor.shutdown(wait=True)
+            worker_pids.close()
 
     bias_summary = _summarize_bias(
         last_bias_snapshot,
@@ -1100,6 +1196,7 @@ def build_lineups(
     min_salary: Optional[int] = None,
     exposure_bias: float | None = None,
     exposure_bias_target: float | None = None,
+    seed: int | None = None,
 ) -> BuildOutput:
     """Generate lineups, optionally distributing work across processes."""
 
@@ -1158,6 +1255,7 @@ def build_lineups(
             min_salary=min_salary,
             exposure_bias=exposure_bias,
             exposure_bias_target=exposure_bias_target,
+            seed=seed,
         )
     except LineupGenerationPartial as exc:
         exc.lineups = exc.lineups[:n_lineups]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from collections import Counter
 from dataclasses import dataclass
 from statistics import fmean, median, pstdev
@@ -9,6 +10,10 @@ from typing import Iterable, Literal, Mapping, Sequence
 
 from pydfs.api.schemas.lineup import LineupResponse
 
+# Below this many values plain float loops beat the ``statistics`` helpers,
+# whose exact-arithmetic paths dominate for the small pools typically exported.
+_SMALL_STATS_THRESHOLD = 64
+
 
 @dataclass(frozen=True)
 class LineupCandidate:
@@ -143,8 +148,19 @@ def _build_summary(
 ) -> FilterSummary:
     def _safe_stats(values: Iterable[float]) -> tuple[float | None, float | None, float | None]:
         values = list(values)
-        if not values:
+        n = len(values)
+        if not n:
             return None, None, None
+        if n <= _SMALL_STATS_THRESHOLD:
+            mean = sum(values) / n
+            ordered = sorted(values)
+            mid = n // 2
+            med = ordered[mid] if n & 1 else 0.5 * (ordered[mid - 1] + ordered[mid])
+            if n > 1:
+                std = math.sqrt(sum((value - mean) ** 2 for value in values) / n)
+            else:
+                std = 0.0
+            return mean, med, std
         mean = fmean(values)
         med = median(values)
         std = pstdev(values) if len(values) > 1 else 0.0
@@ -0,0 +1,228 @@
+"""Minimal in-process ASGI client used by the API tests.
+
+Calls the application directly with a hand-built ``scope`` instead of routing
+through ``httpx.AsyncClient``/``ASGITransport``, which keeps per-request
+overhead down for tests that issue many sequential calls. Tests that only
+inspect a handler's return value can skip ASGI entirely with ``endpoint`` and
+``make_request``.
+"""
+
+from __future__ import annotations
+
+import json as jsonlib
+import urllib.parse
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Callable, Mapping
+
+import anyio
+from starlette.requests import Request
+
+BOUNDARY = "----pydfsTEST"
+
+FileSpec = tuple[str, bytes | str, str]
+
+
+def build_multipart(
+    fields: Mapping[str, str | bytes] | None = None,
+    files: Mapping[str, FileSpec] | None = None,
+    boundary: str = BOUNDARY,
+) -> bytes:
+    """Encode form fields and files as a ``multipart/form-data`` body."""
+
+    marker = f"--{boundary}".encode("ascii")
+    parts: list[bytes] = []
+    for name, value in (fields or {}).items():
+        payload = value if isinstance(value, bytes) else str(value).encode("utf-8")
+        parts.extend(
+            (
+                marker,
+                f'Content-Disposition: form-data; name="{name}"'.encode("utf-8"),
+                b"",
+                payload,
+            )
+        )
+    for name, (filename, content, content_type) in (files or {}).items():
+        payload = content if isinstance(content, bytes) else content.encode("utf-8")
+        parts.extend(
+            (
+                marker,
+                f'Content-Disposition: form-data; name="{name}"; filename="{filename}"'.encode(
+                    "utf-8"
+                ),
+                f"Content-Type: {content_type}".encode("ascii"),
+                b"",
+                payload,
+            )
+        )
+    parts.append(marker + b"--")
+    parts.append(b"")
+    return b"\r\n".join(parts)
+
+
+def multipart_content_type(boundary: str = BOUNDARY) -> str:
+    return f"multipart/form-data; boundary={boundary}"
+
+
+@dataclass
+class Response:
+    """Subset of the ``httpx.Response`` surface used by the tests."""
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes = field(repr=False)
+
+    @cached_property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self) -> Any:
+        return jsonlib.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise AssertionError(f"HTTP {self.status_code}: {self.text}")
+
+
+async def call(
+    app: Any,
+    method: str,
+    path: str,
+    *,
+    params: Mapping[str, Any] | None = None,
+    data: Mapping[str, str | bytes] | None = None,
+    files: Mapping[str, FileSpec] | None = None,
+    json: Any = None,
+    content: bytes | None = None,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Invoke ``app`` once and collect the buffered response.
+
+    There is no connection pool, timeout, or streaming mode to configure;
+    exceptions raised by the app propagate to the caller, matching
+    ``ASGITransport(raise_app_exceptions=True)``.
+    """
+
+    request_headers: dict[str, str] = {"host": "testserver"}
+    if files is not None:
+        body = build_multipart(data, files)
+        request_headers["content-type"] = multipart_content_type()
+    elif json is not None:
+        body = jsonlib.dumps(json).encode("utf-8")
+        request_headers["content-type"] = "application/json"
+    elif data is not None:
+        form = {
+            key: value.decode("utf-8") if isinstance(value, bytes) else value
+            for key, value in data.items()
+        }
+        body = urllib.parse.urlencode(form).encode("ascii")
+        request_headers["content-type"] = "application/x-www-form-urlencoded"
+    else:
+        body = content or b""
+    if headers:
+        request_headers.update({key.lower(): value for key, value in headers.items()})
+    if body:
+        request_headers["content-length"] = str(len(body))
+
+    raw_path, _, query = path.partition("?")
+    if params:
+        extra = urllib.parse.urlencode(params, doseq=True)
+        query = f"{query}&{extra}" if query else extra
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method.upper(),
+        "scheme": "http",
+        "path": urllib.parse.unquote(raw_path),
+        "raw_path": raw_path.encode("ascii"),
+        "query_string": query.encode("ascii"),
+        "root_path": "",
+        "headers": [
+            (key.encode("latin-1"), value.encode("latin-1"))
+            for key, value in request_headers.items()
+        ],
+        "client": ("127.0.0.1", 123),
+        "server": ("testserver", 80),
+    }
+
+    body_sent = False
+    response_complete = anyio.Event()
+    status_code = 500
+    response_headers: dict[str, str] = {}
+    chunks: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            for key, value in message.get("headers", []):
+                response_headers[key.decode("latin-1").lower()] = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    await app(scope, receive, send)
+    response_complete.set()
+    return Response(status_code=status_code, headers=response_headers, content=b"".join(chunks))
+
+
+def endpoint(app: Any, path: str, method: str = "GET") -> Callable[..., Any]:
+    """Return the handler registered for ``method path`` on ``app``.
+
+    ``path`` is the route template (``/ui/pool/{sport}/{site}``), not a
+    concrete URL; handlers are closures inside ``create_app`` and cannot be
+    imported directly.
+    """
+
+    for route in app.router.routes:
+        if getattr(route, "path", None) == path and method.upper() in getattr(
+            route, "methods", ()
+        ):
+            return route.endpoint
+    raise LookupError(f"No {method.upper()} route for {path}")
+
+
+def make_request(path: str, params: Mapping[str, Any] | None = None) -> Request:
+    """Synthesize a bare GET ``Request`` for calling a handler directly."""
+
+    query = urllib.parse.urlencode(params or {}, doseq=True)
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "raw_path": path.encode("ascii"),
+            "query_string": query.encode("ascii"),
+            "headers": [(b"host", b"testserver")],
+        }
+    )
+
+
+class ASGIClient:
+    """Persistent client bound to a single application instance.
+
+    Redirects are never followed; ``follow_redirects`` is accepted for
+    call-site compatibility with ``httpx`` and ignored.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def get(self, path: str, **kwargs: Any) -> Response:
+        kwargs.pop("follow_redirects", None)
+        return await call(self.app, "GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs: Any) -> Response:
+        kwargs.pop("follow_redirects", None)
+        return await call(self.app, "POST", path, **kwargs)
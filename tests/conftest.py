@@ -0,0 +1,98 @@
+"""Shared pytest configuration for the pydfs test suite."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+
+import pytest
+from fastapi import FastAPI
+
+from pydfs.api import create_app
+from pydfs.persistence import RunStore
+from tests._asgi_call import ASGIClient
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Fail collection when a test module is collected from two directories.
+
+    A duplicated module (e.g. a leftover copy of ``test_api.py`` in another
+    folder) would otherwise silently run every expensive optimizer test twice.
+    Same-named tests in differently named modules are fine.
+    """
+
+    seen: dict[tuple[str, str], str] = {}
+    duplicates: list[str] = []
+    for item in items:
+        location = item.nodeid.split("::", 1)[0]
+        key = (os.path.basename(location), item.name)
+        previous = seen.setdefault(key, location)
+        if previous != location:
+            duplicates.append(f"{item.name} ({previous}, {location})")
+    if duplicates:
+        raise pytest.UsageError("duplicate test modules collected: " + ", ".join(duplicates))
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    if uvloop is None:
+        return "asyncio"
+    return ("asyncio", {"loop_factory": uvloop.new_event_loop})
+
+
+def _route_snapshot(app: FastAPI) -> list[tuple[str, tuple[str, ...]]]:
+    return [
+        (getattr(route, "path", ""), tuple(sorted(getattr(route, "methods", None) or ())))
+        for route in app.router.routes
+    ]
+
+
+@pytest.fixture(scope="session")
+def db_keeper():
+    """Connection that keeps the session's in-memory database alive.
+
+    Each session (and each xdist worker) gets its own shared-cache SQLite
+    database, so stored runs and slates never leak in from earlier test runs
+    and no store write touches the disk. ``RunStore`` opens a connection per
+    operation; holding this one open stops SQLite from discarding the
+    database between them. Tests can ``backup`` through it to snapshot and
+    restore the store.
+    """
+
+    db_uri = f"file:pydfs-test-{os.getpid()}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(db_uri, uri=True)
+    try:
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setenv("PYDFS_DB_PATH", db_uri)
+            yield keeper
+    finally:
+        keeper.close()
+
+
+@pytest.fixture(scope="session")
+def app(db_keeper: sqlite3.Connection):
+    """Application shared by the whole session, backed by ``db_keeper``'s database.
+
+    Routing must not be mutated by tests since every module shares this
+    instance.
+    """
+
+    application = create_app()
+    routes = _route_snapshot(application)
+    yield application
+    assert _route_snapshot(application) == routes, "a test mutated the shared app's routes"
+
+
+@pytest.fixture(scope="session")
+def client_and_store(app) -> tuple[ASGIClient, RunStore]:
+    return ASGIClient(app), app.state.run_store
+
+
+@pytest.fixture(scope="session")
+def client(client_and_store: tuple[ASGIClient, RunStore]) -> ASGIClient:
+    return client_and_store[0]
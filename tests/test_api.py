@@ -1,25 +1,102 @@
-import json
+import itertools
+import os
+import sqlite3
+import statistics
 
+import numpy as np
+import orjson
 import pytest
-from httpx import ASGITransport, AsyncClient
-from uuid import uuid4
 
-from pydfs.api import create_app
 from pydfs.api.schemas.lineup import LineupPlayerResponse, LineupResponse
+from pydfs.optimizer import LineupPlayer, LineupResult
+from pydfs.optimizer.service import BuildOutput
+from pydfs.persistence import RunStore
 from pydfs.pool.filtering import FilterCriteria, LineupCandidate, filter_lineups
+from tests._asgi_call import (
+    ASGIClient,
+    build_multipart,
+    endpoint,
+    make_request,
+    multipart_content_type,
+)
 
 
-@pytest.fixture(scope="module")
-async def client():
-    app = create_app()
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as async_client:
-        async_client.app = app
-        yield async_client
+_ClientAndStore = tuple[ASGIClient, RunStore]
 
 
-def _sample_players() -> str:
-    return """Id,Position,First Name,Last Name,Team,Salary,FPPG
+async def _post_standard_lineups(client: ASGIClient) -> dict:
+    resp = await client.post("/lineups", content=_MP_STD, headers=_MP_HEADERS)
+    resp.raise_for_status()
+    return _loads(resp.content)
+
+
+@pytest.fixture(scope="session")
+async def seeded_slate(client: ASGIClient) -> dict:
+    """Single ``/lineups`` run (and solve) shared by tests that read its run or slate."""
+
+    return await _post_standard_lineups(client)
+
+
+@pytest.fixture(scope="session")
+def seeded_store_snapshot(seeded_slate: dict, db_keeper: sqlite3.Connection) -> sqlite3.Connection:
+    """Copy of the store as it stands right after ``seeded_slate`` was posted."""
+
+    snapshot = sqlite3.connect(":memory:")
+    db_keeper.backup(snapshot)
+    return snapshot
+
+
+@pytest.fixture(autouse=True)
+def _restore_seeded_store(request: pytest.FixtureRequest):
+    """Reset the shared store to the seeded state after every test that can write to it.
+
+    Tests are then free to add runs or mutate the seeded slate without
+    leaking state into the next test.
+    """
+
+    if {"client", "client_and_store"}.isdisjoint(request.fixturenames):
+        yield
+        return
+    snapshot = request.getfixturevalue("seeded_store_snapshot")
+    keeper = request.getfixturevalue("db_keeper")
+    yield
+    snapshot.backup(keeper)
+
+
+@pytest.fixture
+def canned_build_lineups(monkeypatch: pytest.MonkeyPatch, seeded_slate: dict) -> list[dict]:
+    """Serve the seeded run's lineups instead of invoking the solver again.
+
+    ``seeded_slate`` remains the integration path through the real optimizer;
+    tests that only care about request/slate bookkeeping use this fixture. The
+    returned list collects the keyword arguments of every stubbed call.
+    """
+
+    calls: list[dict] = []
+
+    lineups = [
+        LineupResult(
+            lineup_id=lineup["lineup_id"],
+            players=tuple(
+                LineupPlayer(**{**player, "positions": tuple(player["positions"])})
+                for player in lineup["players"]
+            ),
+            salary=lineup["salary"],
+            projection=lineup["projection"],
+            baseline_projection=lineup["baseline_projection"],
+        )
+        for lineup in seeded_slate["lineups"]
+    ]
+
+    def _build_lineups(records, *, n_lineups: int = 20, **kwargs: object) -> BuildOutput:
+        calls.append({"n_lineups": n_lineups, **kwargs})
+        return BuildOutput(lineups[:n_lineups], None)
+
+    monkeypatch.setattr("pydfs.api.build_lineups", _build_lineups)
+    return calls
+
+
+_PLAYERS_BYTES = b"""Id,Position,First Name,Last Name,Team,Salary,FPPG
 1,QB,Joe,Quarterback,CIN,8000,20
 2,RB,Rob,Runner,CIN,7500,15
 3,RB,Sam,Rusher,DEN,7200,14
@@ -31,9 +108,7 @@ def _sample_players() -> str:
 9,DEF,Bengals,Defense,CIN,4000,5
 """
 
-
-def _sample_projections() -> str:
-    return """player,team,salary,fantasy,proj_own
+_PROJ_BYTES = b"""player,team,salary,fantasy,proj_own
 Joe Quarterback,CIN,$8000,22.5,18.0
 Rob Runner,CIN,$7500,16.0,12.5
 Sam Rusher,DEN,$7200,15.5,10.0
@@ -45,9 +120,7 @@ Luke Flex,NYJ,$5500,9.0,6.0
 Bengals Defense,CIN,$4000,6.0,4.0
 """
 
-
-def _updated_projections() -> str:
-    return """player,team,salary,fantasy,proj_own
+_UPDATED_BYTES = b"""player,team,salary,fantasy,proj_own
 Joe Quarterback,CIN,$8000,30.5,18.0
 Rob Runner,CIN,$7500,17.0,12.5
 Sam Rusher,DEN,$7200,14.0,10.0
@@ -59,6 +132,70 @@ Luke Flex,NYJ,$5500,8.5,6.0
 Bengals Defense,CIN,$4000,5.0,4.0
 """
 
+_STD_FILES = {
+    "projections": ("projections.csv", _PROJ_BYTES, "text/csv"),
+    "players": ("players.csv", _PLAYERS_BYTES, "text/csv"),
+}
+_PREVIEW_MAPPING_JSON = (
+    "{\"name\": \"player\", \"team\": \"team\", \"salary\": \"salary\", \"projection\": \"fantasy\"}"
+)
+_MAPPING_JSON = (
+    "{\"name\": \"player\", \"team\": \"team\", \"salary\": \"salary\", "
+    "\"projection\": \"fantasy\", \"ownership\": \"proj_own\"}"
+)
+_LINEUP_REQ_JSON = "{\"lineups\": 1}"
+# Pre-encoded multipart bodies for the uploads repeated across tests.
+_MP_HEADERS = {"content-type": multipart_content_type()}
+_MP_STD = build_multipart(
+    {"lineup_request": _LINEUP_REQ_JSON, "projection_mapping": _MAPPING_JSON},
+    _STD_FILES,
+)
+_MP_UPDATE = build_multipart(files={"projections": ("updated.csv", _UPDATED_BYTES, "text/csv")})
+_MP_PREVIEW = build_multipart({"projection_mapping": _PREVIEW_MAPPING_JSON}, _STD_FILES)
+_REQ_CUSTOM_PERT = orjson.dumps(
+    {
+        "lineups": 1,
+        "perturbation_p25": 40,
+        "perturbation_p75": 10,
+        "exposure_bias": 15,
+        "exposure_bias_target": 35,
+    }
+)
+# Two one-lineup batches, so the second batch is solved with real bias factors.
+_REQ_BIAS = orjson.dumps(
+    {"lineups": 2, "lineups_per_job": 1, "exposure_bias": 20, "exposure_bias_target": 30}
+)
+_MP_BIAS = build_multipart(
+    {"lineup_request": _REQ_BIAS, "projection_mapping": _MAPPING_JSON},
+    _STD_FILES,
+)
+_MP_CUSTOM_PERT = build_multipart(
+    {"lineup_request": _REQ_CUSTOM_PERT, "projection_mapping": _MAPPING_JSON},
+    _STD_FILES,
+)
+_loads = orjson.loads
+# Test-only job ids; the pid prefix keeps them distinct across xdist workers.
+_PENDING_PREFIX = f"pending-{os.getpid():x}-"
+_fake_id = itertools.count().__next__
+
+def _pool_needles(slate_id: str) -> tuple[bytes, ...]:
+    # Listed in page order so the body is scanned once.
+    return (
+        b"Lineup Pool",
+        b'name="slate_id"',
+        f'value="{slate_id}" selected'.encode(),
+        b"Replace projections CSV",
+        b"Range: Today",
+    )
+
+
+def _assert_contains_all(body: bytes, needles: tuple[bytes, ...]) -> None:
+    pos = 0
+    for needle in needles:
+        found = body.find(needle, pos)
+        assert found != -1, f"missing from response body after offset {pos}: {needle!r}"
+        pos = found + len(needle)
+
 
 def _candidate(
     lineup_id: str,
@@ -66,13 +203,14 @@ def _candidate(
     baseline: float,
     run_ids: tuple[str, ...] = ("run",),
 ) -> LineupCandidate:
-    lineup = LineupResponse(
+    # Inputs are test-controlled, so skip pydantic validation.
+    lineup = LineupResponse.model_construct(
         lineup_id=lineup_id,
         salary=50000,
         projection=baseline,
         baseline_projection=baseline,
         players=[
-            LineupPlayerResponse(
+            LineupPlayerResponse.model_construct(
                 player_id=player_id,
                 name=f"Player {player_id}",
                 team="TEAM",
@@ -100,48 +238,55 @@ def _candidate(
         usage_percentile=0.0,
         uniqueness_percentile=0.0,
     )
+
+
+def _make_candidates(
+    n: int,
+    players_per: int,
+    pool_size: int,
+    *,
+    seed: int = 0,
+) -> list[LineupCandidate]:
+    """Build ``n`` candidates with distinct random players and descending baselines."""
+
+    rng = np.random.default_rng(seed)
+    player_matrix = np.argsort(rng.random((n, pool_size)), axis=1)[:, :players_per]
+    baselines = np.linspace(100.0, 50.0, n)
+    return [
+        _candidate(f"L{index:04d}", [f"P{player}" for player in row], baseline)
+        for index, (row, baseline) in enumerate(zip(player_matrix.tolist(), baselines.tolist()))
+    ]
+
+
 @pytest.mark.anyio
-async def test_health(client: AsyncClient):
-    resp = await client.get("/health")
-    assert resp.status_code == 200
-    assert resp.json()["status"] == "ok"
+@pytest.mark.xdist_group("api")
+async def test_health(app):
+    health = endpoint(app, "/health")
+    assert await health() == {"status": "ok"}
 
 
 @pytest.mark.anyio
-async def test_preview_endpoint(client: AsyncClient):
-    files = {
-        "projections": ("projections.csv", _sample_projections(), "text/csv"),
-        "players": ("players.csv", _sample_players(), "text/csv"),
-    }
-    data = {
-        "projection_mapping": "{\"name\": \"player\", \"team\": \"team\", \"salary\": \"salary\", \"projection\": \"fantasy\"}",
-    }
-    resp = await client.post("/preview", files=files, data=data)
+@pytest.mark.xdist_group("api")
+async def test_preview_endpoint(client: ASGIClient):
+    resp = await client.post("/preview", content=_MP_PREVIEW, headers=_MP_HEADERS)
     assert resp.status_code == 200
-    body = resp.json()
+    body = _loads(resp.content)
     assert body["matched_players"] == 9
 
 
 @pytest.mark.anyio
-async def test_ui_home(client: AsyncClient):
-    resp = await client.get("/ui")
+@pytest.mark.xdist_group("api")
+async def test_ui_home(app):
+    ui_index = endpoint(app, "/ui")
+    resp = await ui_index(make_request("/ui"))
     assert resp.status_code == 200
-    assert "pydfs Optimizer" in resp.text
+    assert b"pydfs Optimizer" in resp.body
 
 
 @pytest.mark.anyio
-async def test_lineups_endpoint(client: AsyncClient):
-    files = {
-        "projections": ("projections.csv", _sample_projections(), "text/csv"),
-        "players": ("players.csv", _sample_players(), "text/csv"),
-    }
-    data = {
-        "lineup_request": "{\"lineups\": 1}",
-        "projection_mapping": "{\"name\": \"player\", \"team\": \"team\", \"salary\": \"salary\", \"projection\": \"fantasy\", \"ownership\": \"proj_own\"}",
-    }
-    resp = await client.post("/lineups", files=files, data=data)
-    assert resp.status_code == 200
-    payload = resp.json()
+@pytest.mark.xdist_group("api")
+async def test_lineups_endpoint(client: ASGIClient, seeded_slate: dict):
+    payload = seeded_slate
     assert payload["run_id"]
     assert payload["report"]["matched_players"] == 9
     assert len(payload["lineups"]) == 1
@@ -153,14 +298,14 @@ async def test_lineups_endpoint(client: AsyncClient):
     assert payload.get("bias_summary") is not None
 
     run_id = payload["run_id"]
-    resp = await client.get("/runs")
-    assert resp.status_code == 200
-    runs_payload = resp.json()
+    runs_resp = await client.get("/runs")
+    assert runs_resp.status_code == 200
+    runs_payload = _loads(runs_resp.content)
     assert any(run["run_id"] == run_id and run["state"] == "completed" for run in runs_payload)
 
-    resp = await client.get(f"/runs/{run_id}")
-    assert resp.status_code == 200
-    detail = resp.json()
+    detail_resp = await client.get(f"/runs/{run_id}")
+    assert detail_resp.status_code == 200
+    detail = _loads(detail_resp.content)
     assert detail["run_id"] == run_id
     assert detail["site"] == "FD"
     assert detail["sport"] == "NFL"
@@ -176,27 +321,17 @@ async def test_lineups_endpoint(client: AsyncClient):
 
     resp = await client.post(f"/runs/{run_id}/rerun")
     assert resp.status_code == 200
-    rerun_payload = resp.json()
+    rerun_payload = _loads(resp.content)
     assert rerun_payload["run_id"] == run_id
     assert rerun_payload["lineups"], "Stored lineups should be returned"
 
 
 @pytest.mark.anyio
-async def test_lineups_with_stored_slate(client: AsyncClient):
-    files = {
-        "projections": ("projections.csv", _sample_projections(), "text/csv"),
-        "players": ("players.csv", _sample_players(), "text/csv"),
-    }
-    data = {
-        "lineup_request": "{\"lineups\": 1}",
-        "projection_mapping": "{\"name\": \"player\", \"team\": \"team\", \"salary\": \"salary\", \"projection\": \"fantasy\", \"ownership\": \"proj_own\"}",
-    }
-    resp = await client.post("/lineups", files=files, data=data)
-    resp.raise_for_status()
-    first_payload = resp.json()
-    slate_id = first_payload.get("slate_id")
+@pytest.mark.xdist_group("api")
+async def test_lineups_with_stored_slate(client_and_store: _ClientAndStore, seeded_slate: dict):
+    client, store = client_and_store
+    slate_id = seeded_slate.get("slate_id")
     assert slate_id, "First run should store a slate"
-    store = client.app.state.run_store
     slate_record = store.get_slate(slate_id)
     assert slate_record is not None
     assert slate_record.bias_factors
@@ -205,46 +340,40 @@ async def test_lineups_with_stored_slate(client: AsyncClient):
     resp2 = await client.post(
         "/lineups",
         data={
-            "lineup_request": "{\"lineups\": 1}",
+            "lineup_request": _LINEUP_REQ_JSON,
             "slate_id": slate_id,
         },
     )
     resp2.raise_for_status()
-    second_payload = resp2.json()
+    second_payload = _loads(resp2.content)
     assert second_payload["slate_id"] == slate_id
     assert len(second_payload["lineups"]) == 1
     assert second_payload.get("bias_summary")
     detail_again = await client.get(f"/runs/{second_payload['run_id']}")
     detail_again.raise_for_status()
-    run_detail = detail_again.json()
+    run_detail = _loads(detail_again.content)
     assert run_detail["request"]["slate_id"] == slate_id
     assert run_detail.get("bias_summary")
 
 
 @pytest.mark.anyio
-async def test_lineups_with_custom_perturbation_ranges(client: AsyncClient):
-    files = {
-        "projections": ("projections.csv", _sample_projections(), "text/csv"),
-        "players": ("players.csv", _sample_players(), "text/csv"),
-    }
-    request_payload = {
-        "lineups": 1,
-        "perturbation_p25": 40,
-        "perturbation_p75": 10,
-        "exposure_bias": 15,
-        "exposure_bias_target": 35,
-    }
-    data = {
-        "lineup_request": json.dumps(request_payload),
-        "projection_mapping": "{\"name\": \"player\", \"team\": \"team\", \"salary\": \"salary\", \"projection\": \"fantasy\", \"ownership\": \"proj_own\"}",
-    }
-    resp = await client.post("/lineups", files=files, data=data)
+@pytest.mark.xdist_group("api")
+async def test_lineups_with_custom_perturbation_ranges(
+    client: ASGIClient, canned_build_lineups: list[dict]
+):
+    resp = await client.post("/lineups", content=_MP_CUSTOM_PERT, headers=_MP_HEADERS)
     resp.raise_for_status()
-    run_id = resp.json()["run_id"]
+    run_id = _loads(resp.content)["run_id"]
+
+    forwarded = canned_build_lineups[-1]
+    assert forwarded["perturbation_p25"] == pytest.approx(40.0)
+    assert forwarded["perturbation_p75"] == pytest.approx(10.0)
+    assert forwarded["exposure_bias"] == pytest.approx(15.0)
+    assert forwarded["exposure_bias_target"] == pytest.approx(35.0)
 
     detail_resp = await client.get(f"/runs/{run_id}")
     detail_resp.raise_for_status()
-    detail = detail_resp.json()
+    detail = _loads(detail_resp.content)
     assert detail["request"]["perturbation_p25"] == pytest.approx(40.0)
     assert detail["request"]["perturbation_p75"] == pytest.approx(10.0)
     assert detail["request"].get("slate_id")
@@ -254,68 +383,55 @@ async def test_lineups_with_custom_perturbation_ranges(client: AsyncClient):
 
 
 @pytest.mark.anyio
-async def test_cancel_endpoint(client: AsyncClient):
-    files = {
-        "projections": ("projections.csv", _sample_projections(), "text/csv"),
-        "players": ("players.csv", _sample_players(), "text/csv"),
-    }
-    data = {
-        "lineup_request": "{\"lineups\": 1}",
-        "projection_mapping": "{\"name\": \"player\", \"team\": \"team\", \"salary\": \"salary\", \"projection\": \"fantasy\", \"ownership\": \"proj_own\"}",
-    }
-    resp = await client.post("/lineups", files=files, data=data)
-    resp.raise_for_status()
-    run_id = resp.json()["run_id"]
+@pytest.mark.xdist_group("api")
+async def test_cancel_endpoint(client_and_store: _ClientAndStore, seeded_slate: dict):
+    client, store = client_and_store
+    run_id = seeded_slate["run_id"]
 
     cancel_resp = await client.post(f"/runs/{run_id}/cancel")
     assert cancel_resp.status_code == 200
-    cancel_body = cancel_resp.json()
+    cancel_body = _loads(cancel_resp.content)
     assert cancel_body["state"] == "completed"
 
-    store = client.app.state.run_store
-    pending_id = uuid4().hex
+    pending_id = f"{_PENDING_PREFIX}{_fake_id():08x}"
     store.create_job(run_id=pending_id, site="FD", sport="NFL", state="running")
 
     pending_cancel = await client.post(f"/runs/{pending_id}/cancel")
     assert pending_cancel.status_code == 200
-    pending_body = pending_cancel.json()
+    pending_body = _loads(pending_cancel.content)
     assert pending_body["state"] == "cancel_requested"
     assert pending_body["cancel_requested_at"] is not None
 
     runs_resp = await client.get("/runs")
     runs_resp.raise_for_status()
-    assert any(item["run_id"] == pending_id and item["state"] == "cancel_requested" for item in runs_resp.json())
+    runs_list = _loads(runs_resp.content)
+    assert any(item["run_id"] == pending_id and item["state"] == "cancel_requested" for item in runs_list)
 
     missing = await client.post("/runs/does-not-exist/cancel")
     assert missing.status_code == 404
 
 
 @pytest.mark.anyio
-async def test_lineup_pool_page(client: AsyncClient):
+@pytest.mark.xdist_group("api")
+async def test_lineup_pool_page(client_and_store: _ClientAndStore, seeded_slate: dict):
+    client, store = client_and_store
     resp = await client.get("/ui/pool")
     assert resp.status_code == 200
-    assert "Lineup Pool" in resp.text
-    assert "name=\"slate_id\"" in resp.text
-    assert "Range: Today" in resp.text
-    assert "Replace projections CSV" in resp.text
-    store = client.app.state.run_store
     latest_slate = store.get_latest_slate()
     assert latest_slate is not None
-    assert f"value=\"{latest_slate.slate_id}\" selected" in resp.text
+    _assert_contains_all(resp.content, _pool_needles(latest_slate.slate_id))
 
-    resp_filtered = await client.get("/ui/pool", params={"site": "FD", "sport": "NFL", "limit": 10})
+    resp_filtered = await client.get("/ui/pool", params={"site": "FD", "sport": "NFL", "limit": "10"})
     assert resp_filtered.status_code == 200
-    assert "Runs in Pool" in resp_filtered.text
+    _assert_contains_all(resp_filtered.content, (b"Runs in Pool",))
 
     resp_shortcut = await client.get("/ui/pool/nfl/fd")
     assert resp_shortcut.status_code == 200
-    assert "Lineup Pool" in resp_shortcut.text
-    assert f"value=\"{latest_slate.slate_id}\" selected" in resp_shortcut.text
+    _assert_contains_all(resp_shortcut.content, _pool_needles(latest_slate.slate_id))
 
     resp_sport_only = await client.get("/ui/pool/nfl")
     assert resp_sport_only.status_code == 200
-    assert "Lineup Pool" in resp_sport_only.text
-    assert "Current Slate" in resp_sport_only.text
+    _assert_contains_all(resp_sport_only.content, (b"Lineup Pool", b"Current Slate"))
 
 
 def test_filter_lineups_applies_max_exposure_cap():
@@ -349,25 +465,45 @@ def test_filter_lineups_respects_player_specific_caps():
     assert selected_ids == ["L2"], "Lineups containing capped players should be excluded"
 
 
+def test_filter_lineups_exposure_cap_holds_across_large_pool():
+    candidates = _make_candidates(200, players_per=9, pool_size=30)
+    result = filter_lineups(candidates, FilterCriteria(limit=50, max_player_exposure=0.5))
+
+    assert result.lineups
+    exposure_counts: dict[str, int] = {}
+    for lineup in result.lineups:
+        for player in lineup.candidate.lineup.players:
+            exposure_counts[player.player_id] = exposure_counts.get(player.player_id, 0) + 1
+    assert max(exposure_counts.values()) <= 0.5 * len(result.lineups)
+
+
+def test_filter_lineups_summary_stats_small_pool():
+    candidates = [
+        _candidate("L1", ["A", "B"], 100),
+        _candidate("L2", ["C", "D"], 90),
+        _candidate("L3", ["E", "F"], 80),
+        _candidate("L4", ["G", "H"], 70),
+    ]
+    result = filter_lineups(candidates, FilterCriteria())
+
+    summary = result.summary
+    assert summary.baseline_mean == pytest.approx(statistics.fmean([100, 90, 80, 70]))
+    assert summary.baseline_median == pytest.approx(85.0)
+    assert summary.baseline_std == pytest.approx(statistics.pstdev([100, 90, 80, 70]))
+
+
 @pytest.mark.anyio
-async def test_update_slate_projections_from_pool(client: AsyncClient):
-    files = {
-        "projections": ("projections.csv", _sample_projections(), "text/csv"),
-        "players": ("players.csv", _sample_players(), "text/csv"),
-    }
-    data = {
-        "lineup_request": "{\"lineups\": 1}",
-        "projection_mapping": "{\"name\": \"player\", \"team\": \"team\", \"salary\": \"salary\", \"projection\": \"fantasy\", \"ownership\": \"proj_own\"}",
-    }
-    resp = await client.post("/lineups", files=files, data=data)
-    resp.raise_for_status()
-    payload = resp.json()
-    slate_id = payload["slate_id"]
-    store = client.app.state.run_store
+@pytest.mark.xdist_group("api")
+async def test_update_slate_projections_from_pool(
+    client_and_store: _ClientAndStore, seeded_slate: dict
+):
+    client, store = client_and_store
+    slate_id = seeded_slate["slate_id"]
 
     update_resp = await client.post(
         f"/ui/pool/{slate_id}/update",
-        files={"projections": ("updated.csv", _updated_projections(), "text/csv")},
+        content=_MP_UPDATE,
+        headers=_MP_HEADERS,
         follow_redirects=False,
     )
     assert update_resp.status_code == 303
@@ -381,25 +517,20 @@ async def test_update_slate_projections_from_pool(client: AsyncClient):
     follow_url = update_resp.headers["location"]
     follow_resp = await client.get(follow_url)
     assert follow_resp.status_code == 200
-    assert "Projections updated" in follow_resp.text
-    assert "updated.csv" in follow_resp.text
+    assert b"Projections updated" in follow_resp.content
+    assert b"updated.csv" in follow_resp.content
 
 
 @pytest.mark.anyio
-async def test_reset_slate_bias(client: AsyncClient):
-    files = {
-        "projections": ("projections.csv", _sample_projections(), "text/csv"),
-        "players": ("players.csv", _sample_players(), "text/csv"),
-    }
-    data = {
-        "lineup_request": json.dumps({"lineups": 1, "exposure_bias": 20, "exposure_bias_target": 30}),
-    }
-    resp = await client.post("/lineups", files=files, data=data)
+@pytest.mark.xdist_group("api")
+async def test_reset_slate_bias(client_and_store: _ClientAndStore):
+    client, store = client_and_store
+    resp = await client.post("/lineups", content=_MP_BIAS, headers=_MP_HEADERS)
     resp.raise_for_status()
-    slate_id = resp.json()["slate_id"]
-    store = client.app.state.run_store
+    slate_id = _loads(resp.content)["slate_id"]
     slate = store.get_slate(slate_id)
     assert slate and slate.bias_factors
+    assert any(factor != pytest.approx(1.0) for factor in slate.bias_factors.values())
 
     reset_resp = await client.post(
         f"/slates/{slate_id}/reset-bias",
@@ -413,19 +544,9 @@ async def test_reset_slate_bias(client: AsyncClient):
 
 
 @pytest.mark.anyio
-async def test_pool_filter_and_export(client: AsyncClient):
-    files = {
-        "projections": ("projections.csv", _sample_projections(), "text/csv"),
-        "players": ("players.csv", _sample_players(), "text/csv"),
-    }
-    data = {
-        "lineup_request": "{\"lineups\": 3}",
-        "projection_mapping": "{\"name\": \"player\", \"team\": \"team\", \"salary\": \"salary\", \"projection\": \"fantasy\", \"ownership\": \"proj_own\"}",
-    }
-    run_resp = await client.post("/lineups", files=files, data=data)
-    run_resp.raise_for_status()
-    run_payload = run_resp.json()
-    slate_id = run_payload.get("slate_id")
+@pytest.mark.xdist_group("api")
+async def test_pool_filter_and_export(client: ASGIClient, seeded_slate: dict):
+    slate_id = seeded_slate.get("slate_id")
     assert slate_id
 
     filter_request = {
@@ -437,7 +558,7 @@ async def test_pool_filter_and_export(client: AsyncClient):
     }
     filter_resp = await client.post("/pool/filter", json=filter_request)
     filter_resp.raise_for_status()
-    body = filter_resp.json()
+    body = _loads(filter_resp.content)
     assert body["pool_summary"]["available_lineups"] >= body["summary"]["available_lineups"]
     assert body["summary"]["available_lineups"] >= 1
     assert body["lineups"], "Filtered lineups should not be empty"
@@ -449,8 +570,8 @@ async def test_pool_filter_and_export(client: AsyncClient):
     export_url = f"/pool/export.csv?slate_id={slate_id}&include_players=1&filter_limit=2"
     export_resp = await client.get(export_url)
     export_resp.raise_for_status()
-    lines = [line for line in export_resp.text.strip().splitlines() if line]
+    lines = [line for line in export_resp.content.strip().splitlines() if line]
     assert lines, "Export CSV should contain data"
-    header = lines[0].split(",")
-    assert header[0] == "EntryName"
-    assert any(cell.startswith("QB") for cell in header[1:])
+    header = lines[0].split(b",")
+    assert header[0] == b"EntryName"
+    assert any(cell.startswith(b"QB") for cell in header[1:])
@@ -5,9 +5,111 @@ import pytest
 from pydfs.ingest import (
     ProjectionRow,
     infer_site_variant,
+    load_projection_csv,
     merge_player_and_projection_files,
     rows_to_records,
 )
+from pydfs.ingest import projections as projections_module
+
+# Players/projections CSV pairs for the merge tests, written to disk once per session.
+_MERGE_CASES: dict[str, tuple[str, str]] = {
+    "basic": (
+        (
+            "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
+            "1,WR,Ja'Marr,Chase,CIN,9300,14.1\n"
+        ),
+        (
+            "player,team,salary,fantasy\n"
+            "Ja'Marr Chase,CIN,$9400,18.5\n"
+        ),
+    ),
+    "full_team_names": (
+        (
+            "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
+            "1,QB,Joe,Burrow,CIN,9000,20.1\n"
+            "2,WR,Tyreek,Hill,MIA,8900,19.4\n"
+        ),
+        (
+            "player,team,salary,fantasy\n"
+            "Joe Burrow,Cincinnati Bengals,$9100,23.5\n"
+            "Tyreek Hill,Miami Dolphins,$9000,22.1\n"
+        ),
+    ),
+    "missing_salary": (
+        (
+            "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
+            "1,QB,Joe,Burrow,CIN,9000,20.1\n"
+        ),
+        (
+            "player,team,salary,fantasy\n"
+            "Joe Burrow,Cincinnati Bengals,N/A,23.5\n"
+        ),
+    ),
+    "defense_names": (
+        (
+            "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
+            "10,DEF,Miami,Dolphins,MIA,4500,6.5\n"
+        ),
+        (
+            "player,team,salary,fantasy\n"
+            "Miami D/ST,Miami Dolphins,$4400,7.1\n"
+        ),
+    ),
+    "roster_mismatch": (
+        (
+            "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
+            "1,QB,Joe,Burrow,CIN,9000,20.1\n"
+        ),
+        (
+            "player,team,salary,fantasy\n"
+            "Backup Bengals Player,CIN,$4500,8.2\n"
+        ),
+    ),
+    "out_of_slate": (
+        (
+            "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
+            "1,QB,Joe,Burrow,CIN,9000,20.1\n"
+        ),
+        (
+            "player,team,salary,fantasy\n"
+            "Dak Prescott,DAL,$8500,22.4\n"
+        ),
+    ),
+    "manual_override": (
+        (
+            "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
+            "5,WR,John,Doe,CIN,6500,9.4\n"
+        ),
+        (
+            "player,team,salary,fantasy\n"
+            "Johnny Doe,CIN,$6600,12.5\n"
+        ),
+    ),
+    "defense_team_from_name": (
+        (
+            "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
+            "20,DEF,Baltimore,Ravens,,4600,6.2\n"
+        ),
+        (
+            "player,team,salary,fantasy\n"
+            "Baltimore D/ST,,4500,7.5\n"
+        ),
+    ),
+}
+_PROJECTION_MAPPING = {"name": "player", "team": "team", "salary": "salary", "projection": "fantasy"}
+
+
+@pytest.fixture(scope="session")
+def merge_fixture_paths(tmp_path_factory: pytest.TempPathFactory) -> dict[str, tuple[Path, Path]]:
+    base = tmp_path_factory.mktemp("ingest")
+    paths: dict[str, tuple[Path, Path]] = {}
+    for key, (players_text, projections_text) in _MERGE_CASES.items():
+        players_csv = base / f"{key}_players.csv"
+        players_csv.write_text(players_text)
+        projections_csv = base / f"{key}_projections.csv"
+        projections_csv.write_text(projections_text)
+        paths[key] = (players_csv, projections_csv)
+    return paths
 
 
 def _row(**kwargs):
@@ -98,6 +200,24 @@ def test_rows_to_records_single_game_uses_fallback_by_name():
     assert records[0].metadata["base_positions"] == ("WR",)
 
 
+def test_projection_row_resolver_extracts_fields():
+    mapping = {"player_id": "Id", "name": "First|Last", "team": "Team", "salary": "Salary", "ownership": "Own"}
+    convert = ProjectionRow.resolver(mapping)
+    rows = [
+        {"Id": " 7 ", "First": "Aaron", "Last": "Judge", "Team": "NYY", "Salary": "4500", "Own": "12.5"},
+        {"Id": "8", "First": "", "Last": "Solo", "Team": "BOS", "Salary": "3000", "Own": "n/a"},
+    ]
+
+    converted = [convert(row) for row in rows]
+    assert converted[0].raw_id == "7"
+    assert converted[0].raw_name == "Aaron Judge"
+    assert converted[0].ownership == 12.5
+    assert converted[1].raw_name == "Solo"
+    assert converted[1].ownership is None
+    assert converted[1].raw_projection == "0"
+    assert converted[1].raw_position is None
+
+
 def test_infer_site_variant_detects_single_game_tokens():
     rows = [
         _row(player_id="p1", name="Player One", team="BOS", position="MVP", salary="12000", projection="35"),
@@ -109,25 +229,25 @@ def test_infer_site_variant_detects_single_game_tokens():
     assert sport == "NBA"
 
 
-def test_merge_players_and_projections(tmp_path: Path):
-    players_csv = tmp_path / "players.csv"
-    players_csv.write_text(
-        "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
-        "1,WR,Ja'Marr,Chase,CIN,9300,14.1\n"
-    )
+def test_load_projection_csv_strips_utf8_bom(tmp_path: Path):
+    # Excel saves CSVs with a UTF-8 BOM in front of the first header.
+    bom_csv = tmp_path / "bom_projections.csv"
+    bom_csv.write_bytes(b"\xef\xbb\xbfplayer,team,salary,fantasy\nJoe Q,CIN,$8000,22.5\n")
 
-    projections_csv = tmp_path / "projections.csv"
-    projections_csv.write_text(
-        "player,team,salary,fantasy\n"
-        "Ja'Marr Chase,CIN,$9400,18.5\n"
-    )
+    (row,) = load_projection_csv(bom_csv, mapping=_PROJECTION_MAPPING)
+    assert row.raw_name == "Joe Q"
+    assert row.raw_projection == "22.5"
+
+
+def test_merge_players_and_projections(merge_fixture_paths: dict[str, tuple[Path, Path]]):
+    players_csv, projections_csv = merge_fixture_paths["basic"]
 
     records, report = merge_player_and_projection_files(
         players_path=players_csv,
         projections_path=projections_csv,
         site="FD",
         sport="NFL",
-        projection_mapping={"name": "player", "team": "team", "salary": "salary", "projection": "fantasy"},
+        projection_mapping=_PROJECTION_MAPPING,
     )
 
     assert len(records) == 1
@@ -138,27 +258,15 @@ def test_merge_players_and_projections(tmp_path: Path):
     assert not report.players_missing_projection
 
 
-def test_merge_handles_full_team_names(tmp_path: Path):
-    players_csv = tmp_path / "players.csv"
-    players_csv.write_text(
-        "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
-        "1,QB,Joe,Burrow,CIN,9000,20.1\n"
-        "2,WR,Tyreek,Hill,MIA,8900,19.4\n"
-    )
-
-    projections_csv = tmp_path / "projections.csv"
-    projections_csv.write_text(
-        "player,team,salary,fantasy\n"
-        "Joe Burrow,Cincinnati Bengals,$9100,23.5\n"
-        "Tyreek Hill,Miami Dolphins,$9000,22.1\n"
-    )
+def test_merge_handles_full_team_names(merge_fixture_paths: dict[str, tuple[Path, Path]]):
+    players_csv, projections_csv = merge_fixture_paths["full_team_names"]
 
     records, report = merge_player_and_projection_files(
         players_path=players_csv,
         projections_path=projections_csv,
         site="FD",
         sport="NFL",
-        projection_mapping={"name": "player", "team": "team", "salary": "salary", "projection": "fantasy"},
+        projection_mapping=_PROJECTION_MAPPING,
     )
 
     assert report.matched_players == 2
@@ -167,50 +275,30 @@ def test_merge_handles_full_team_names(tmp_path: Path):
     assert teams["Tyreek Hill"] == "MIA"
 
 
-def test_merge_handles_missing_salary(tmp_path: Path):
-    players_csv = tmp_path / "players.csv"
-    players_csv.write_text(
-        "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
-        "1,QB,Joe,Burrow,CIN,9000,20.1\n"
-    )
-
-    projections_csv = tmp_path / "projections.csv"
-    projections_csv.write_text(
-        "player,team,salary,fantasy\n"
-        "Joe Burrow,Cincinnati Bengals,N/A,23.5\n"
-    )
+def test_merge_handles_missing_salary(merge_fixture_paths: dict[str, tuple[Path, Path]]):
+    players_csv, projections_csv = merge_fixture_paths["missing_salary"]
 
     records, report = merge_player_and_projection_files(
         players_path=players_csv,
         projections_path=projections_csv,
         site="FD",
         sport="NFL",
-        projection_mapping={"name": "player", "team": "team", "salary": "salary", "projection": "fantasy"},
+        projection_mapping=_PROJECTION_MAPPING,
     )
 
     assert report.matched_players == 1
     assert records[0].salary == 9000
 
 
-def test_merge_handles_defense_names(tmp_path: Path):
-    players_csv = tmp_path / "players.csv"
-    players_csv.write_text(
-        "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
-        "10,DEF,Miami,Dolphins,MIA,4500,6.5\n"
-    )
-
-    projections_csv = tmp_path / "projections.csv"
-    projections_csv.write_text(
-        "player,team,salary,fantasy\n"
-        "Miami D/ST,Miami Dolphins,$4400,7.1\n"
-    )
+def test_merge_handles_defense_names(merge_fixture_paths: dict[str, tuple[Path, Path]]):
+    players_csv, projections_csv = merge_fixture_paths["defense_names"]
 
     records, report = merge_player_and_projection_files(
         players_path=players_csv,
         projections_path=projections_csv,
         site="FD",
         sport="NFL",
-        projection_mapping={"name": "player", "team": "team", "salary": "salary", "projection": "fantasy"},
+        projection_mapping=_PROJECTION_MAPPING,
     )
 
     assert report.matched_players == 1
@@ -218,25 +306,15 @@ def test_merge_handles_defense_names(tmp_path: Path):
     assert records[0].positions == ["D"]
 
 
-def test_merge_flags_manual_review_for_roster_mismatch(tmp_path: Path):
-    players_csv = tmp_path / "players.csv"
-    players_csv.write_text(
-        "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
-        "1,QB,Joe,Burrow,CIN,9000,20.1\n"
-    )
-
-    projections_csv = tmp_path / "projections.csv"
-    projections_csv.write_text(
-        "player,team,salary,fantasy\n"
-        "Backup Bengals Player,CIN,$4500,8.2\n"
-    )
+def test_merge_flags_manual_review_for_roster_mismatch(merge_fixture_paths: dict[str, tuple[Path, Path]]):
+    players_csv, projections_csv = merge_fixture_paths["roster_mismatch"]
 
     _, report = merge_player_and_projection_files(
         players_path=players_csv,
         projections_path=projections_csv,
         site="FD",
         sport="NFL",
-        projection_mapping={"name": "player", "team": "team", "salary": "salary", "projection": "fantasy"},
+        projection_mapping=_PROJECTION_MAPPING,
     )
 
     assert len(report.manual_review) == 1
@@ -246,50 +324,30 @@ def test_merge_flags_manual_review_for_roster_mismatch(tmp_path: Path):
     assert report.ignored_projection_rows == []
 
 
-def test_merge_ignores_out_of_slate_projections(tmp_path: Path):
-    players_csv = tmp_path / "players.csv"
-    players_csv.write_text(
-        "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
-        "1,QB,Joe,Burrow,CIN,9000,20.1\n"
-    )
-
-    projections_csv = tmp_path / "projections.csv"
-    projections_csv.write_text(
-        "player,team,salary,fantasy\n"
-        "Dak Prescott,DAL,$8500,22.4\n"
-    )
+def test_merge_ignores_out_of_slate_projections(merge_fixture_paths: dict[str, tuple[Path, Path]]):
+    players_csv, projections_csv = merge_fixture_paths["out_of_slate"]
 
     _, report = merge_player_and_projection_files(
         players_path=players_csv,
         projections_path=projections_csv,
         site="FD",
         sport="NFL",
-        projection_mapping={"name": "player", "team": "team", "salary": "salary", "projection": "fantasy"},
+        projection_mapping=_PROJECTION_MAPPING,
     )
 
     assert report.manual_review == []
     assert report.ignored_projection_rows == ["Dak Prescott"]
 
 
-def test_merge_manual_override_resolves_unmatched_projection(tmp_path: Path):
-    players_csv = tmp_path / "players.csv"
-    players_csv.write_text(
-        "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
-        "5,WR,John,Doe,CIN,6500,9.4\n"
-    )
-
-    projections_csv = tmp_path / "projections.csv"
-    projections_csv.write_text(
-        "player,team,salary,fantasy\n"
-        "Johnny Doe,CIN,$6600,12.5\n"
-    )
+def test_merge_manual_override_resolves_unmatched_projection(merge_fixture_paths: dict[str, tuple[Path, Path]]):
+    players_csv, projections_csv = merge_fixture_paths["manual_override"]
 
     records, report = merge_player_and_projection_files(
         players_path=players_csv,
         projections_path=projections_csv,
         site="FD",
         sport="NFL",
-        projection_mapping={"name": "player", "team": "team", "salary": "salary", "projection": "fantasy"},
+        projection_mapping=_PROJECTION_MAPPING,
     )
 
     assert len(records) == 0
@@ -301,7 +359,7 @@ def test_merge_manual_override_resolves_unmatched_projection(tmp_path: Path):
         projections_path=projections_csv,
         site="FD",
         sport="NFL",
-        projection_mapping={"name": "player", "team": "team", "salary": "salary", "projection": "fantasy"},
+        projection_mapping=_PROJECTION_MAPPING,
         manual_overrides={manual_key: "5"},
     )
 
@@ -311,27 +369,58 @@ def test_merge_manual_override_resolves_unmatched_projection(tmp_path: Path):
     assert records_override[0].player_id == "5"
 
 
-def test_merge_infers_defense_team_from_name(tmp_path: Path):
-    players_csv = tmp_path / "players.csv"
-    players_csv.write_text(
-        "Id,Position,First Name,Last Name,Team,Salary,FPPG\n"
-        "20,DEF,Baltimore,Ravens,,4600,6.2\n"
-    )
-
-    projections_csv = tmp_path / "projections.csv"
-    projections_csv.write_text(
-        "player,team,salary,fantasy\n"
-        "Baltimore D/ST,,4500,7.5\n"
-    )
+def test_merge_infers_defense_team_from_name(merge_fixture_paths: dict[str, tuple[Path, Path]]):
+    players_csv, projections_csv = merge_fixture_paths["defense_team_from_name"]
 
     records, report = merge_player_and_projection_files(
         players_path=players_csv,
         projections_path=projections_csv,
         site="FD",
         sport="NFL",
-        projection_mapping={"name": "player", "team": "team", "salary": "salary", "projection": "fantasy"},
+        projection_mapping=_PROJECTION_MAPPING,
     )
 
     assert report.matched_players == 1
     assert records[0].team == "BAL"
     assert records[0].positions == ["D"]
+
+
+def test_team_token_strips_punctuation_and_non_ascii():
+    assert projections_module._team_token("Miami D/ST") == "MIAMIDST"
+    assert projections_module._team_token("St. Louis Rams") == "STLOUISRAMS"
+    assert projections_module._team_token("Montréal\tAlouettes") == "MONTRALALOUETTES"
+    assert projections_module._canonical_team("San Francisco 49ers", "nfl") == "SF"
+
+
+def test_infer_team_from_name_strips_defense_suffixes():
+    infer = projections_module._infer_team_from_name
+    assert infer("Miami Defense", "NFL") == "MIA"
+    assert infer("Philadelphia D/ST", "NFL") == "PHI"
+    assert infer("Green Bay def", "NFL") == "GB"
+    assert infer("Nowhere DST", "NFL") is None
+
+
+def test_rows_to_records_share_team_and_position_strings():
+    rows = [
+        _row(player_id="h1", name="Hitter One", team="nym", position="OF", salary="3200", projection="9.1"),
+        _row(player_id="h2", name="Hitter Two", team="nym", position="OF", salary="3100", projection="8.7"),
+    ]
+
+    first, second = rows_to_records(rows, site="FD", sport="MLB")
+    assert first.team == "NYM"
+    assert first.team is second.team
+    assert first.positions == second.positions == ["OF"]
+    assert first.positions is not second.positions
+    assert first.positions[0] is second.positions[0]
+
+
+def test_canonical_positions_cached_per_site_and_sport():
+    canonical = projections_module._canonical_positions
+    assert canonical("FD", "NFL", "DEF") == ["D"]
+    assert canonical("FD", "NFL", "OL/TE") == ["TE"]
+    assert canonical("FD", "MLB", "1B/OF") == ["1B", "OF"]
+    assert canonical("FD", "MLB", "") == []
+
+    first = canonical("FD", "MLB", "1B/OF")
+    first.append("C")
+    assert canonical("FD", "MLB", "1B/OF") == ["1B", "OF"]
@@ -1,19 +1,30 @@
-import random
+import multiprocessing as mp
+import threading
+import time
 
+import numpy as np
 import pytest
 
 from pydfs.models import PlayerRecord
 from pydfs.optimizer import build_lineups
 from pydfs.optimizer.service import (
+    _PlayerTable,
     _apply_bias_to_records,
     _expand_single_game_records,
+    _filter_player_pool,
     _perturb_projections,
     _perturbation_window,
+    _perturbation_windows,
+    _rank_windows,
+    _start_worker_pool,
+    _terminate_executor,
 )
 
 
-def _sample_pool() -> list[PlayerRecord]:
-    return [
+@pytest.fixture(scope="module")
+def sample_pool() -> tuple[PlayerRecord, ...]:
+    # Records are frozen, so one validated pool is shared by every test here.
+    return (
         PlayerRecord(player_id="p1", name="Pitcher One", team="NYM", positions=["P"], salary=9000, projection=20.0),
         PlayerRecord(player_id="p2", name="Pitcher Two", team="ATL", positions=["P"], salary=8800, projection=18.5),
         PlayerRecord(player_id="c1", name="Catcher One", team="LAD", positions=["C"], salary=2800, projection=9.2),
@@ -31,12 +42,12 @@ def _sample_pool() -> list[PlayerRecord]:
         PlayerRecord(player_id="ut1", name="Utility One", team="BOS", positions=["1B"], salary=3000, projection=9.1),
         PlayerRecord(player_id="ut2", name="Utility Two", team="ATL", positions=["OF"], salary=3100, projection=8.5),
         PlayerRecord(player_id="ut3", name="Utility Three", team="LAD", positions=["C/1B"], salary=2950, projection=8.3),
-    ]
+    )
 
 
-def test_build_lineups_generates_lineup():
+def test_build_lineups_generates_lineup(sample_pool: tuple[PlayerRecord, ...]):
     output = build_lineups(
-        _sample_pool(),
+        sample_pool,
         site="FD",
         sport="MLB",
         n_lineups=1,
@@ -51,8 +62,8 @@ def test_build_lineups_generates_lineup():
     assert output.bias_summary is None
 
 
-def test_build_lineups_respects_locks_and_excludes():
-    pool = _sample_pool()
+def test_build_lineups_respects_locks_and_excludes(sample_pool: tuple[PlayerRecord, ...]):
+    pool = list(sample_pool)
     locked = {"p2"}
     excluded = {"p1"}
 
@@ -72,6 +83,84 @@ def test_build_lineups_respects_locks_and_excludes():
     assert "p2" in ids
 
 
+def test_build_lineups_renumbers_lineups_across_batches(sample_pool: tuple[PlayerRecord, ...]):
+    output = build_lineups(
+        sample_pool,
+        site="FD",
+        sport="MLB",
+        n_lineups=3,
+        lineups_per_job=1,
+        max_exposure=None,
+    )
+
+    assert [lineup.lineup_id for lineup in output.lineups] == ["L001", "L002", "L003"]
+
+
+def test_build_lineups_parallel_stops_early_without_leaking_workers(sample_pool: tuple[PlayerRecord, ...]):
+    # Two one-lineup batches stay in flight, so reaching the target leaves one
+    # batch pending and the executor has to be torn down mid-run.
+    output = build_lineups(
+        sample_pool,
+        site="FD",
+        sport="MLB",
+        n_lineups=2,
+        parallel_jobs=2,
+        lineups_per_job=1,
+        max_exposure=None,
+    )
+
+    assert [lineup.lineup_id for lineup in output.lineups] == ["L001", "L002"]
+    assert mp.active_children() == []
+
+
+def test_terminate_executor_stops_busy_workers():
+    executor, worker_pids = _start_worker_pool(2)
+    futures = [executor.submit(time.sleep, 10) for _ in range(3)]
+    while not all(future.running() for future in futures[:2]):
+        time.sleep(0.01)
+
+    # Run the teardown on a daemon thread so a regression fails fast instead
+    # of blocking until the sleeping jobs finish.
+    stopper = threading.Thread(target=_terminate_executor, args=(executor, worker_pids), daemon=True)
+    stopper.start()
+    stopper.join(timeout=5)
+
+    assert not stopper.is_alive()
+    assert mp.active_children() == []
+
+def test_filter_player_pool_keeps_top_projections_per_position(
+    monkeypatch: pytest.MonkeyPatch, sample_pool: tuple[PlayerRecord, ...]
+):
+    monkeypatch.setenv("PYDFS_PLAYER_RETAIN", "0.5")
+    monkeypatch.setenv("PYDFS_PLAYER_MIN_PER_POS", "1")
+    pool = list(sample_pool)
+
+    kept = {record.player_id for record in _filter_player_pool(pool, mandatory_ids={"c2"})}
+
+    assert {"of1", "of2"} <= kept
+    assert not {"of3", "of4", "ut2"} & kept
+    assert {"p1", "c1", "c2", "ut3"} <= kept
+    assert "p2" not in kept
+
+
+def test_build_lineups_seed_makes_perturbed_runs_reproducible(sample_pool: tuple[PlayerRecord, ...]):
+    def run() -> list[tuple[str, ...]]:
+        output = build_lineups(
+            sample_pool,
+            site="FD",
+            sport="MLB",
+            n_lineups=3,
+            lineups_per_job=1,
+            perturbation_p25=40.0,
+            perturbation_p75=20.0,
+            max_exposure=None,
+            seed=7,
+        )
+        return [tuple(player.player_id for player in lineup.players) for lineup in output.lineups]
+
+    assert run() == run()
+
+
 def test_perturbation_window_shapes_variance():
     low = _perturbation_window(0.25, 0.4, 0.1)
     assert pytest.approx(low, rel=1e-6) == 0.4
@@ -89,6 +178,43 @@ def test_perturbation_window_shapes_variance():
     assert pytest.approx(summit, rel=1e-6) == 0.1 * 0.5
 
 
+def test_perturbation_windows_matches_scalar_window():
+    percentiles = np.linspace(0.0, 1.0, 41)
+    expected = [max(0.0, _perturbation_window(float(p), 0.4, 0.1)) for p in percentiles]
+    assert _perturbation_windows(percentiles, 0.4, 0.1).tolist() == pytest.approx(expected, rel=1e-12)
+
+
+def test_rank_windows_is_cached_and_read_only():
+    table = _rank_windows(5, 0.4, 0.1)
+    assert _rank_windows(5, 0.4, 0.1) is table
+    assert table.tolist() == pytest.approx(
+        [_perturbation_window(rank / 4, 0.4, 0.1) for rank in range(5)], rel=1e-12
+    )
+    with pytest.raises(ValueError):
+        table[0] = 1.0
+
+
+def test_player_table_copies_only_changed_records():
+    records = [
+        PlayerRecord(player_id=f"p{idx}", name=f"P{idx}", team="NYM", positions=["OF"], salary=3000, projection=float(idx))
+        for idx in range(3)
+    ]
+    table = _PlayerTable.from_records(records)
+
+    assert len(table) == 3
+    assert table.projection.tolist() == [0.0, 1.0, 2.0]
+    assert not table.projection.flags.writeable
+    assert table == table
+    assert table != _PlayerTable.from_records(records)
+    assert {table: 1}[table] == 1
+
+    updated = table.to_records(np.array([0.0, 5.0, 2.0]))
+    assert updated[0] is records[0]
+    assert updated[2] is records[2]
+    assert updated[1].projection == 5.0
+    assert records[1].projection == 1.0
+
+
 def test_perturb_projections_respects_percentiles():
     records = [
         PlayerRecord(player_id=f"p{i}", name=f"Player {i}", team="TEAM", positions=["UTIL"], salary=5000 + i, projection=float(i))
@@ -98,26 +224,38 @@ def test_perturb_projections_respects_percentiles():
     perturbed = _perturb_projections(records, seed=17, percentile_25=40.0, percentile_75=10.0)
     assert len(perturbed) == len(records)
 
-    rng = random.Random(17)
-    indexed = list(enumerate(records))
-    sorted_pairs = sorted(indexed, key=lambda item: item[1].projection)
+    sorted_pairs = sorted(enumerate(records), key=lambda item: item[1].projection)
     max_rank = max(len(records) - 1, 1)
-    expected_windows = {}
+    expected_windows = [0.0] * len(records)
     for rank, (original_index, player) in enumerate(sorted_pairs):
         percentile = rank / max_rank
-        expected_windows[original_index] = _perturbation_window(percentile, 0.4, 0.1)
+        expected_windows[original_index] = max(0.0, _perturbation_window(percentile, 0.4, 0.1))
 
-    for idx, (original, updated) in enumerate(zip(records, perturbed)):
-        window = expected_windows[idx]
+    expected_offsets = np.random.default_rng(17).uniform(
+        -np.array(expected_windows), np.array(expected_windows)
+    )
+    for window, expected_offset, original, updated in zip(
+        expected_windows, expected_offsets, records, perturbed
+    ):
         if window <= 0:
             assert pytest.approx(updated.projection, rel=1e-9) == original.projection
             continue
-        expected_offset = rng.uniform(-window, window)
-        expected_offset = max(-0.99, min(0.99, expected_offset))
+        expected_offset = max(-0.99, min(0.99, float(expected_offset)))
         actual_offset = (updated.projection / original.projection) - 1.0
         assert pytest.approx(actual_offset, rel=1e-9) == expected_offset
 
 
+def test_perturb_projections_share_metadata_with_source():
+    records = [
+        PlayerRecord(player_id=f"p{i}", name=f"Player {i}", team="TEAM", positions=["UTIL"], salary=5000, projection=float(i), metadata={"slot": i})
+        for i in range(1, 4)
+    ]
+
+    perturbed = _perturb_projections(records, seed=5, percentile_25=20.0, percentile_75=20.0)
+    for original, updated in zip(records, perturbed):
+        assert updated.metadata is original.metadata
+
+
 def test_apply_bias_to_records_adjusts_projection():
     records = [
         PlayerRecord(player_id="p1", name="One", team="A", positions=["UTIL"], salary=5000, projection=10.0),
@@ -131,6 +269,19 @@ def test_apply_bias_to_records_adjusts_projection():
     assert biased[1].metadata["bias_factor"] == pytest.approx(0.8)
 
 
+def test_apply_bias_to_records_clamps_and_annotates_unbiased_players():
+    records = [
+        PlayerRecord(player_id="p1", name="One", team="A", positions=["UTIL"], salary=5000, projection=10.0),
+        PlayerRecord(player_id="p2", name="Two", team="A", positions=["UTIL"], salary=5200, projection=8.0),
+    ]
+    biased = _apply_bias_to_records(records, {"p1": -0.5})
+    assert biased[0].projection == 0.0
+    assert biased[0].metadata["bias_factor"] == 0.0
+    assert biased[1].projection == pytest.approx(8.0)
+    assert biased[1].metadata["bias_factor"] == 1.0
+    assert biased[1].metadata["baseline_projection"] == pytest.approx(8.0)
+
+
 def test_expand_single_game_records_creates_variants():
     base = PlayerRecord(
         player_id="p1",
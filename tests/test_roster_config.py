@@ -17,3 +17,17 @@ def test_get_rules_by_key_string_alias():
 def test_get_rules_missing_raises():
     with pytest.raises(KeyError):
         get_rules("FD", "CURLING")
+
+
+def test_get_rules_caches_lookups():
+    get_rules.cache_clear()
+    get_rules_by_key.cache_clear()
+
+    first = get_rules("fd", "nfl")
+    assert get_rules("fd", "nfl") is first
+    assert get_rules.cache_info().hits == 1
+    assert get_rules.cache_info().misses == 1
+
+    get_rules_by_key("FD_NFL")
+    get_rules_by_key("FD_NFL")
+    assert get_rules_by_key.cache_info().hits == 1